@@ -4,9 +4,183 @@ from ev3dev2.sensor import INPUT_1
 from ev3dev2.sensor.lego import ColorSensor
 from ev3dev2.sound import Sound
 
-import socket, pickle, _thread, serial
-from queue import Queue
-from time import sleep
+import socket, selectors, struct, threading, pickle
+from enum import IntEnum
+from functools import lru_cache
+from collections import deque
+from time import sleep, monotonic
+
+# Every message on the wire is prefixed with its length as a 4-byte big-endian integer.
+_HEADER = struct.Struct('!I')
+_RECV_SIZE = 65536
+
+# Largest message the robot accepts. Real messages are a few bytes, a larger length means the peer doesn't speak the
+# framed protocol, e.g. an old server sending unframed pickles.
+_MAX_FRAME_SIZE = 64 * 1024
+
+# Size of the kernel's send and receive buffers for the socket, large enough to absorb a burst of commands.
+_SOCKET_BUFFER_SIZE = 256 * 1024
+
+# TCP_QUICKACK turns off delayed ACKs. It only exists on Linux, and the kernel may turn delayed ACKs back on, so it's
+# re-armed after every read.
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+
+# Seconds the control loop waits for a command before it checks if the robot is still running.
+RECV_TIMEOUT = 0.5
+
+# Seconds move() waits for a direction before it gives up and lets the control loop check the robot again.
+DIRECTION_TIMEOUT = 0.5
+
+# Put in a queue to wake up and stop its consumer, stop() puts it in the direction_queue and disconnect() in the
+# send queue.
+_STOP = object()
+
+# Max amount of buffers gathered into one sendmsg call, IOV_MAX on Linux.
+_SEND_BATCH = 1024
+
+# Opcodes of the messages exchanged with the server. Every message starts with its opcode as an unsigned byte,
+# coordinate messages are followed by x and y as signed 16-bit integers.
+OP_END, OP_MANUAL, OP_AUTO, OP_START, OP_STOP, OP_COORD, OP_POS, OP_HELLO, OP_DONE, OP_FORWARD, OP_BACKWARD, \
+    OP_LEFT, OP_RIGHT, OP_PICKUP, OP_DROPOFF, OP_NO_PATH = range(16)
+_OPCODE = struct.Struct('!B')
+_COORD = struct.Struct('!Bhh')
+# The x and y of a coordinate message, and their offset in a whole message including its length prefix. Position
+# updates only repack these fields into a prebuilt message.
+_XY = struct.Struct('!hh')
+_XY_OFFSET = _HEADER.size + _OPCODE.size
+
+# Opcodes of the commands that change the state of the robot instead of moving it. They're numbered from 0 so they can
+# index Robot._COMMAND_HANDLERS directly.
+_COMMANDS = frozenset((OP_END, OP_MANUAL, OP_AUTO, OP_START, OP_STOP))
+
+# The name of the direction each opcode received from the server stands for.
+_MOVES = {
+    OP_FORWARD: "forward", OP_BACKWARD: "backward", OP_LEFT: "left", OP_RIGHT: "right",
+    OP_PICKUP: "pickup", OP_DROPOFF: "dropoff", OP_NO_PATH: False,
+}
+
+# Messages without a payload are packed once up front.
+_MESSAGES = {opcode: _OPCODE.pack(opcode) for opcode in (OP_HELLO, OP_DONE, OP_END)}
+
+# The old pickle protocol, only spoken when the robot is created with debug_pickle. Commands and fixed messages are
+# plain strings there, the fixed messages are pickled once up front.
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+_PICKLE_COMMANDS = {"end": OP_END, "manual": OP_MANUAL, "auto": OP_AUTO, "start": OP_START, "stop": OP_STOP}
+_PICKLE_MOVES = {name: opcode for opcode, name in _MOVES.items() if name}
+_PICKLE_MESSAGES = {
+    opcode: pickle.dumps(message, protocol=_PICKLE_PROTOCOL)
+    for opcode, message in ((OP_HELLO, "robot"), (OP_DONE, "done"), (OP_END, "end"))
+}
+
+# The pickled position update ["pos", (x, y)] is pickled once as well, including its length prefix. The coordinates
+# are pickled as 4-byte ints from two marker values, so updates only repack them at the markers' offsets.
+_PICKLE_INT = struct.Struct('<i')
+_PICKLE_POSITION = pickle.dumps(["pos", (0x7ffffffe, 0x7fffffff)], protocol=_PICKLE_PROTOCOL)
+_PICKLE_POSITION = _HEADER.pack(len(_PICKLE_POSITION)) + _PICKLE_POSITION
+_PICKLE_X_OFFSET = _PICKLE_POSITION.index(b'J' + _PICKLE_INT.pack(0x7ffffffe)) + 1
+_PICKLE_Y_OFFSET = _PICKLE_POSITION.index(b'J' + _PICKLE_INT.pack(0x7fffffff)) + 1
+
+def _decode(payload):
+    """
+    Decodes a message from the server. Commands are returned as (opcode, None) and directions as (None, opcode),
+    coordinates as (None, (x, y)).
+
+    Parameters
+    ----------
+    payload: bytes
+        The message, without its length prefix.
+
+    Raises
+    ------
+    ValueError:
+        If the message has an unknown opcode, ValueError is raised.
+    """
+    opcode = payload[0]
+    if opcode in _COMMANDS:
+        return opcode, None
+    if opcode == OP_COORD:
+        return None, _COORD.unpack(payload)[1:]
+    if opcode in _MOVES:
+        return None, opcode
+    raise ValueError("Unknown opcode " + str(opcode) + " received from the server!")
+
+def _decode_pickle(payload):
+    """
+    Decodes a message from the server in the old pickle protocol, in the same way as _decode.
+
+    Parameters
+    ----------
+    payload: bytes
+        The message, without its length prefix.
+
+    Raises
+    ------
+    ValueError:
+        If the message isn't a known command or direction, False or a coordinate (x, y), ValueError is raised.
+    """
+    data = pickle.loads(payload)
+    if isinstance(data, str):
+        if data in _PICKLE_COMMANDS:
+            return _PICKLE_COMMANDS[data], None
+        if data in _PICKLE_MOVES:
+            return None, _PICKLE_MOVES[data]
+    elif data is False:
+        return None, OP_NO_PATH
+    elif isinstance(data, tuple) and len(data) == 2 and all(isinstance(value, int) for value in data):
+        return None, data
+    raise ValueError("Unknown message " + repr(data) + " received from the server!")
+
+class Direction(IntEnum):
+    """
+    The cardinal directions the robot can face, numbered clockwise so turning is modular arithmetic.
+    """
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
+# The Direction for each direction name.
+_DIRECTION_NAMES = {direction.name.lower(): direction for direction in Direction}
+
+def _to_direction(direction):
+    """
+    Converts a direction name such as "north" into a Direction, a Direction is returned as it is.
+
+    Parameters
+    ----------
+    direction: string or Direction
+        The direction that should be converted.
+
+    Raises
+    ------
+    ValueError:
+        If the input isn't either east, west, north or south, ValueError is raised.
+    """
+    if isinstance(direction, Direction):
+        return direction
+    try:
+        return _DIRECTION_NAMES[direction]
+    except (KeyError, TypeError):
+        raise ValueError("The direction has to be either west, east, north or south!")
+
+@lru_cache(maxsize=256)
+def _speed(percent):
+    """
+    Returns a SpeedPercent for the percent, created once and then reused for every motor command.
+    """
+    return SpeedPercent(percent)
+
+# Minimum amount of seconds between two position updates sent to the server.
+POSITION_UPDATE_INTERVAL = 0.05
+
+# Seconds the robot is allowed to cross one cell before it gives up, both in run/back and move_to_coords.
+CELL_TIMEOUT = 10.0
+
+# Seconds between two reads of the color sensor while waiting for a red line.
+COLOR_POLL_INTERVAL = 0.01
+
+# Layout of the color sensor's binary data in RGB-RAW mode, red, green and blue as signed 16-bit integers.
+_RGB_RAW = '<hhh'
 
 class Robot():
     """
@@ -33,7 +207,22 @@ class Robot():
     disconnect(self)
         Disconnects the robot to the server.
     """
-    def __init__(self, current_location_x=0, current_location_y=0, current_direction="north", host='127.0.1.1', port=2526, pos=(1, 1)):
+    # The robots attributes are fixed, so they're stored in slots instead of a per instance dict.
+    __slots__ = (
+        "SERVER_HOST", "SERVER_PORT", "MANUAL", "DEBUG_PICKLE", "PICKUP", "wheels_motor", "arm_motor", "color_sensor",
+        "speaker", "current_location_x", "current_location_y", "current_direction", "sock", "direction_queue", "id",
+        "_decode", "_messages", "_run_event", "_control_thread", "_recv_thread", "_selector", "_direction_event",
+        "_recv_buffer", "_recv_chunk", "_recv_view", "_send_queue", "_send_event", "_sender_thread", "_red_event",
+        "_poll_event", "_color_thread", "_position_frame", "_last_sent_position", "_last_sent_time",
+    )
+
+    # The (steering, rotations) used by turn_cardinal, indexed by how many quarter turns clockwise the robot turns.
+    _TURNS = (None, (100, 90), (100, 180), (-100, 90))
+
+    # The change in (x, y) when the robot moves one cell forward, indexed by the Direction it faces.
+    _STEPS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+    def __init__(self, current_location_x=0, current_location_y=0, current_direction="north", host='127.0.1.1', port=2526, pos=(1, 1), debug_pickle=False):
         """
         Initialize the robot class, with a host and port as optional input.
 
@@ -43,6 +232,8 @@ class Robot():
             A string with the IP address to the server.
         port(=2526): int
             A port number to the server.
+        debug_pickle(=False): boolean
+            Talks to the server with the old pickle protocol instead of the binary one, for debugging only.
 
         Attributes
         ----------
@@ -54,6 +245,8 @@ class Robot():
             Flag that's indicates if the robot is in manual mode.
         RUN: bollean
             Flag that's indicates if the robot is running.
+        DEBUG_PICKLE: boolean
+            Flag that's indicates if the robot talks to the server with the old pickle protocol.
         brick: brick
             The LEGO brick object.
         left_motor: Motor
@@ -62,18 +255,22 @@ class Robot():
             Motor object that controls the right motor of the robot.
         light_sensor: Color20
             Light sensor object for the robot.
-        temperature_sensor: Temperature
-            Temperature sensor object for the robot.
         sock : socket
             The robot sock.
-        direction_queue : Queue
+        direction_queue : deque
             A queue with coordinate the robot should move_to_coords towards.
         """
         self.SERVER_HOST = host
         self.SERVER_PORT = port
         self.MANUAL = False
-        self.RUN = False
+        self.DEBUG_PICKLE = debug_pickle
+        self._decode = _decode_pickle if debug_pickle else _decode
+        self._messages = _PICKLE_MESSAGES if debug_pickle else _MESSAGES
+        self._run_event = threading.Event()
+        self._control_thread = None
+        self._recv_thread = None
         self.PICKUP = True
+        self.id = None
         self.wheels_motor = MoveSteering(OUTPUT_A, OUTPUT_B)
         self.arm_motor = MediumMotor(OUTPUT_C)
         self.color_sensor = ColorSensor(INPUT_1)
@@ -83,14 +280,52 @@ class Robot():
         self.current_location_y = current_location_y
         self.assign_coordinate(current_location_x, current_location_y, current_direction)
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.direction_queue = Queue()
+        # Commands and position updates are tiny, so don't let Nagle's algorithm hold them back.
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+        self._quickack()
+        self._selector = selectors.DefaultSelector()
+        self.direction_queue = deque()
+        self._direction_event = threading.Event()
+        self._recv_buffer = bytearray()
+        self._recv_chunk = bytearray(_RECV_SIZE)
+        self._recv_view = memoryview(self._recv_chunk)
+        self._send_queue = deque()
+        self._send_event = threading.Event()
+        self._sender_thread = None
+        self._red_event = threading.Event()
+        self._poll_event = threading.Event()
+        self._color_thread = None
+        if debug_pickle:
+            self._position_frame = bytearray(_PICKLE_POSITION)
+        else:
+            self._position_frame = bytearray(_HEADER.pack(_COORD.size) + _COORD.pack(OP_POS, 0, 0))
+        self._last_sent_position = None
+        self._last_sent_time = float("-inf")
 
     def __del__(self):
         """
         Disconnects the robot if the robot object is removed.
         """
+        self._selector.close()
         self.sock.close()
 
+    @property
+    def RUN(self):
+        """
+        Flag that's indicates if the robot is running, backed by an event so it can be shared between threads.
+        """
+        return self._run_event.is_set()
+
+    @RUN.setter
+    def RUN(self, value):
+        if value:
+            self._run_event.set()
+        else:
+            self._run_event.clear()
+
     def connect(self):
         """
         Setting up the connection for the robot to the server.
@@ -103,12 +338,14 @@ class Robot():
         try:
             print("Connecting to server on IP: " + str(self.SERVER_HOST) + " and port: " + str(self.SERVER_PORT))
             self.sock.connect((self.SERVER_HOST, self.SERVER_PORT))
-            self.sock.sendall(pickle.dumps('robot'))
+            self._selector.register(self.sock, selectors.EVENT_READ)
+            self._start_sender()
+            self._send_message(OP_HELLO)
             self.RUN = True
-
-            self.recv(1)
-        except:
-            raise Exception("The robot couldn't connect to the server!")
+            self._recv_thread = threading.Thread(target=self._recv_loop, name="robot-recv")
+            self._recv_thread.start()
+        except OSError as error:
+            raise Exception("The robot couldn't connect to the server!") from error
 
 
     def recv(self, amount=None):
@@ -126,74 +363,286 @@ class Robot():
         ------
         Exception:
             If input isn't None or an int, Exception is raised.
-        """
-        if (type(amount) == int) | (amount == None):
-            if amount == None:
-                while True:
-                    self._recv_aux()
-            else:
-                for i in range(amount):
-                    self._recv_aux()
+
+        Exception:
+            If the receive thread started by connect is running, it's the only one that may read from the server and
+            Exception is raised.
+        """
+        if self._recv_thread is not None and self._recv_thread.is_alive():
+            raise Exception("Commands are already received by the receive thread started in connect!")
+        if amount is None:
+            while True:
+                self._recv_aux()
+        elif isinstance(amount, int):
+            for i in range(amount):
+                self._recv_aux()
         else:
             raise Exception("Invalid input! Input has to be an int.")
 
-    def _recv_aux(self):
+    def _recv_aux(self, timeout=None):
+        """
+        Aux function to the recv function. Returns False if no command arrived within timeout seconds, otherwise True.
+        Malformed commands are reported and skipped.
+
+        Parameters
+        ----------
+        timeout(=None): float
+            The amount of seconds to wait for a command, if left empty it waits until a command arrives.
+
+        Raises
+        ------
+        ConnectionError:
+            If the server closes the connection, ConnectionError is raised.
+        """
+        payload = self._recv_frame(timeout)
+        if payload is None:
+            return False
+        self._handle(payload)
+        return True
+
+    def _handle(self, payload):
         """
-        Aux function to the recv function.
+        Decodes a message from the server and queues the direction or runs the command in it. Malformed commands are
+        reported and skipped.
+
+        Parameters
+        ----------
+        payload: bytes
+            The message, without its length prefix.
         """
         try:
-            print("Trying to receive a new command from server...")
-            data = pickle.loads(self.sock.recv(4096))
-            if data == "end":
-                self.RUN = False
-                self.disconnect()
-                return
-            elif data == "manual":
-                print("Manual Mode activated!")
-                self.MANUAL = True
-            elif data == "auto":
-                print("Auto Mode activated!")
-                self.MANUAL = False
-            elif data == "start":
-                print("Robot started!")
-                _thread.start_new_thread(self._start_aux(), ())
-            elif data == "stop":
-                print("Robot stopped!")
-                self.stop()
-            else:
-                print("Successfully received a direction from the server! (" + str(data) + ")")
-                self.direction_queue.put(data)
+            opcode, data = self._decode(payload)
+        except (ValueError, IndexError, EOFError, struct.error, pickle.UnpicklingError) as error:
+            print("Failed to decode command from server! (" + str(error) + ")")
+            return
+        if opcode is None:
+            print("Successfully received a direction from the server! (" + str(_MOVES.get(data, data)) + ")")
+            self.direction_queue.append(data)
+            self._direction_event.set()
+        else:
+            self._COMMAND_HANDLERS[opcode](self)
+
+    def _on_end(self):
+        """
+        Handles an end command from the server.
+        """
+        self.RUN = False
+        self.disconnect()
+
+    def _on_manual(self):
+        """
+        Handles a manual command from the server.
+        """
+        print("Manual Mode activated!")
+        self.MANUAL = True
+
+    def _on_auto(self):
+        """
+        Handles an auto command from the server.
+        """
+        print("Auto Mode activated!")
+        self.MANUAL = False
+
+    def _on_start(self):
+        """
+        Handles a start command from the server.
+        """
+        print("Robot started!")
+        self.start()
+
+    def _on_stop(self):
+        """
+        Handles a stop command from the server.
+        """
+        print("Robot stopped!")
+        self.stop()
+
+    def _recv_frame(self, timeout=None):
+        """
+        Returns the payload of the next message from the server. Data is read from the socket in large chunks into a
+        preallocated buffer and then queued, so a burst of commands only costs one recv call.
+
+        Parameters
+        ----------
+        timeout(=None): float
+            The amount of seconds to wait for data from the server, if left empty it waits until data arrives. If no
+            data arrives in time, None is returned.
+
+        Raises
+        ------
+        ConnectionError:
+            If the server closes the connection before a whole message is read, or sends a message longer than
+            _MAX_FRAME_SIZE, ConnectionError is raised.
+        """
+        buffer = self._recv_buffer
+        while True:
+            if len(buffer) >= _HEADER.size:
+                (size,) = _HEADER.unpack_from(buffer)
+                if size > _MAX_FRAME_SIZE:
+                    raise ConnectionError("The server sent a message of " + str(size) + " bytes, the robot only "
+                                          "accepts " + str(_MAX_FRAME_SIZE) + "!")
+                end = _HEADER.size + size
+                if len(buffer) >= end:
+                    with memoryview(buffer) as view:
+                        payload = bytes(view[_HEADER.size:end])
+                    del buffer[:end]
+                    return payload
+            if not self._selector.select(timeout):
+                return None
+            count = self.sock.recv_into(self._recv_chunk)
+            if not count:
+                raise ConnectionError("The server closed the connection!")
+            buffer += self._recv_view[:count]
+            self._quickack()
+
+    def _quickack(self):
+        """
+        Asks the kernel to acknowledge received data right away instead of delaying the ACK, where it's supported.
+        """
+        if _TCP_QUICKACK is not None:
+            self.sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+
+    def _start_sender(self):
+        """
+        Starts the thread that sends the queued messages to the server.
+        """
+        self._sender_thread = threading.Thread(target=self._sender_loop, name="robot-sender", daemon=True)
+        self._sender_thread.start()
+
+    def _sender_loop(self):
+        """
+        Aux function to the sender thread. Waits for messages in the send queue and sends everything that has piled up
+        with a single sendmsg call, until _STOP is taken from the queue.
+        """
+        queue = self._send_queue
+        while True:
+            self._send_event.wait()
+            self._send_event.clear()
+            batch = []
+            stop = False
+            while len(batch) < _SEND_BATCH:
+                try:
+                    buffer = queue.popleft()
+                except IndexError:
+                    break
+                if buffer is _STOP:
+                    stop = True
+                    break
+                batch.append(buffer)
+            if len(batch) == _SEND_BATCH:
+                self._send_event.set()
+            if batch:
+                try:
+                    sent = self.sock.sendmsg(batch)
+                    if sent < sum(map(len, batch)):
+                        self.sock.sendall(b"".join(batch)[sent:])
+                except OSError as e:
+                    print("Couldn't send to the server: " + str(e))
+                    return
+            if stop:
                 return
-        except:
-            print("Failed to receive command from server!")
-            pass
 
-    def start(self):
+    def _send(self, payload):
         """
-        Function that starts the robot in a new thread.
+        Queues a payload, prefixed with its length, for the sender thread. The messages that pile up while the sender
+        thread is busy leave together in the next sendmsg call.
+
+        Parameters
+        ----------
+        payload: bytes
+            The encoded message that should be sent.
         """
-        _thread.start_new_thread(self._start_aux(), ())
+        self._send_queue.extend((_HEADER.pack(len(payload)), payload))
+        self._send_event.set()
 
-    def _start_aux(self):
+    def _send_message(self, opcode):
         """
-        Aux function to the start function.
+        Sends a message without payload to the server.
+
+        Parameters
+        ----------
+        opcode: int
+            The opcode of the message, either OP_HELLO, OP_DONE or OP_END.
         """
-        self.speaker.speak("Go Go Gadget!")
+        self._send(self._messages[opcode])
+
+    def start(self):
+        """
+        Function that starts the robot in a new thread, unless the robot is already running. If the robot is still
+        stopping, the new thread waits for the old one to finish its last move before it takes over.
+        """
+        previous = self._control_thread
+        if previous is not None and previous.is_alive():
+            if self.RUN:
+                print("Robot is already running!")
+                return
+        else:
+            previous = None
+        self._control_thread = threading.Thread(target=self._start_aux, args=(previous,), name="robot-control")
         self.RUN = True
-        while self.RUN:
-            self.recv(1)
-            self.move()
+        self._control_thread.start()
 
-            self.sock.sendall(pickle.dumps("done"))
+    def _start_aux(self, previous=None):
+        """
+        Aux function to the start function. Commands are received by the receive thread started in connect, so the
+        robot keeps moving while the server sends the next directions. The loop ends when the robot stops or another
+        control thread takes over.
 
-        self.recv(1)
+        Parameters
+        ----------
+        previous(=None): Thread
+            The control thread that's still stopping, it's waited for so only one thread moves the robot at a time.
+        """
+        if previous is not None:
+            previous.join()
+        while _STOP in self.direction_queue:
+            self.direction_queue.remove(_STOP)
+        self.speaker.speak("Go Go Gadget!")
+        current = threading.current_thread()
+        try:
+            while self.RUN and self._control_thread is current:
+                if self.move() is None:
+                    self._send_message(OP_DONE)
+        except TimeoutError as error:
+            print(str(error) + " Robot stopped!")
+        finally:
+            if self._control_thread is current:
+                self._halt()
+
+    def _recv_loop(self):
+        """
+        Aux function to the receive thread. Receives commands until the connection is closed by an end command, if the
+        socket fails the robot is stopped. A command that fails is reported and the next command is received.
+        """
+        while self.sock.fileno() != -1:
+            try:
+                payload = self._recv_frame(RECV_TIMEOUT)
+            except OSError as error:
+                if self.sock.fileno() != -1:
+                    print("Lost the connection to the server! (" + str(error) + ")")
+                    self._halt()
+                return
+            if payload is None:
+                continue
+            try:
+                self._handle(payload)
+            except Exception as error:
+                print("Failed to handle command from server! (" + repr(error) + ")")
 
     def stop(self):
         """
         Function that stops the robot.
         """
+        self._halt()
         self.speaker.speak("Bye Bye Bitchers!")
+
+    def _halt(self):
+        """
+        Clears RUN and wakes up a move() that waits for a direction, so the control thread ends.
+        """
         self.RUN = False
+        self.direction_queue.append(_STOP)
+        self._direction_event.set()
 
     def turn_cardinal(self, direction):
         """
@@ -201,53 +650,20 @@ class Robot():
 
         Parameters
         ----------
-        direction: string
+        direction: string or Direction
             The cardinal direction the robot should face.
 
         Raises
         ------
-            Exception:
-                If the input isn't either east, west, north or south, Exception is raised.
-        """
-        if (direction == "west") | (direction == "east") | (direction == "north") | (direction == "south"):
-            if self.current_direction != direction:
-                if self.current_direction == "west":
-                    if direction == "east":
-                        self.wheels_motor.on_for_rotations(100, SpeedPercent(25), 180)
-                    elif direction == "north":
-                        self.wheels_motor.on_for_rotations(100, SpeedPercent(25), 90)
-                    elif direction == "south":
-                        self.wheels_motor.on_for_rotations(-100, SpeedPercent(25), 90)
-
-                elif self.current_direction == "east":
-                    if direction == "west":
-                        self.wheels_motor.on_for_rotations(-100, SpeedPercent(25), 180)
-                    elif direction == "north":
-                        self.wheels_motor.on_for_rotations(-100, SpeedPercent(25), 90)
-                    elif direction == "south":
-                        self.wheels_motor.on_for_rotations(100, SpeedPercent(25), 90)
-
-                elif self.current_direction == "north":
-                    if direction == "west":
-                        self.wheels_motor.on_for_rotations(-100, SpeedPercent(25), 90)
-                    elif direction == "east":
-                        self.wheels_motor.on_for_rotations(100, SpeedPercent(25), 90)
-                    elif direction == "south":
-                        self.wheels_motor.on_for_rotations(100, SpeedPercent(25), 180)
-
-                elif self.current_direction == "south":
-                        if direction == "west":
-                            self.wheels_motor.on_for_rotations(-100, SpeedPercent(25), 90)
-                        elif direction == "east":
-                            self.wheels_motor.on_for_rotations(100, SpeedPercent(25), 90)
-                        elif direction == "north":
-                            self.wheels_motor.on_for_rotations(100, SpeedPercent(25), 180)
-
-                self.current_direction = direction
-            else:
-                pass
-        else:
-            raise Exception("The direction has to be a string with either west, east, north and south!")
+            ValueError:
+                If the input isn't either east, west, north or south, ValueError is raised.
+        """
+        direction = _to_direction(direction)
+        if direction == self.current_direction:
+            return
+        steering, rotations = self._TURNS[(direction - self.current_direction) % 4]
+        self.wheels_motor.on_for_rotations(steering, _speed(25), rotations)
+        self.current_direction = direction
 
     def run(self, speed=25):
         """
@@ -262,16 +678,13 @@ class Robot():
         ------
         Exception:
             If the input isn't an int, Exception is raised.
+
+        TimeoutError:
+            If no red line is found within CELL_TIMEOUT seconds, the robot brakes and TimeoutError is raised.
         """
-        if type(speed) is int:
-                self.wheels_motor.on(steering = 0, speed = speed)
-                while True:
-                    red = self.color_sensor.value(0)
-                    green = self.color_sensor.value(1)
-                    blue = self.color_sensor.value(2)
-                    if(red > 50 and green in range(0,50) and blue in range(0,50)):
-                        print('RED')
-                        break
+        if isinstance(speed, int):
+                self.wheels_motor.on(steering = 0, speed = _speed(speed))
+                self._wait_for_red(CELL_TIMEOUT)
                 sleep(0.5)
                 self.brake()
 
@@ -291,22 +704,61 @@ class Robot():
         ------
         Exception:
             If the input isn't an int, Exception is raised.
+
+        TimeoutError:
+            If no red line is found within CELL_TIMEOUT seconds, the robot brakes and TimeoutError is raised.
         """
-        if type(speed) is int:
-                self.wheels_motor.on(steering = 0, speed = -speed)
-                while True:
-                    red = self.color_sensor.value(0)
-                    green = self.color_sensor.value(1)
-                    blue = self.color_sensor.value(2)
-                    if(red > 50 and green in range(0,50) and blue in range(0,50)):
-                        print('RED')
-                        break
+        if isinstance(speed, int):
+                self.wheels_motor.on(steering = 0, speed = _speed(-speed))
+                self._wait_for_red(CELL_TIMEOUT)
                 sleep(0.5)
                 self.brake()
 
         else:
             raise Exception("The speed has to be an int!")
 
+    def _wait_for_red(self, timeout=None):
+        """
+        Blocks until the color sensor sees a red line. The sensor is polled by the color thread, which is started the
+        first time the robot waits for a red line.
+
+        Parameters
+        ----------
+        timeout(=None): float
+            The amount of seconds to wait for a red line, if left empty it waits until one is found.
+
+        Raises
+        ------
+        TimeoutError:
+            If no red line is found in time, the robot brakes and TimeoutError is raised.
+        """
+        if self._color_thread is None:
+            self._color_thread = threading.Thread(target=self._color_loop, name="robot-color", daemon=True)
+            self._color_thread.start()
+        self._red_event.clear()
+        self._poll_event.set()
+        if not self._red_event.wait(timeout):
+            self._poll_event.clear()
+            self.brake()
+            raise TimeoutError("The robot didn't find a red line within " + str(timeout) + " seconds!")
+        print('RED')
+
+    def _color_loop(self):
+        """
+        Aux function to the color thread. While the robot waits for a red line the sensor is polled every
+        COLOR_POLL_INTERVAL seconds, all three colors are read at once from the sensor's binary data. When red is
+        seen the polling pauses and _red_event is set.
+        """
+        bin_data = self.color_sensor.bin_data
+        while True:
+            self._poll_event.wait()
+            red, green, blue = bin_data(_RGB_RAW)
+            if red > 50 and 0 <= green < 50 and 0 <= blue < 50:
+                self._poll_event.clear()
+                self._red_event.set()
+            else:
+                sleep(COLOR_POLL_INTERVAL)
+
     def brake(self):
         """
         Breaks the robots movement.
@@ -315,30 +767,56 @@ class Robot():
 
     def lift_arm(self):
         """
-        Lifts the robots arm
+        Lifts the robots arm, without waiting for the arm motor to finish so the robot can keep handling directions.
         """
-        self.arm_motor.on_for_seconds(speed = 5, seconds = 1)
+        self.arm_motor.on_for_seconds(speed = _speed(5), seconds = 1, block = False)
 
     def lower_arm(self):
-        self.arm_motor.on_for_seconds(speed = -5, seconds = 1)
+        """
+        Lowers the robots arm, without waiting for the arm motor to finish so the robot can keep handling directions.
+        """
+        self.arm_motor.on_for_seconds(speed = _speed(-5), seconds = 1, block = False)
 
     def disconnect(self):
         """
         Closing down the connection between the robot and the server.
         """
         print("Robot disconnecting...")
-        self.sock.sendall(pickle.dumps("end"))
-        sleep(1)
+        self._send_message(OP_END)
+        self._send_queue.append(_STOP)
+        self._send_event.set()
+        if self._sender_thread is not None:
+            self._sender_thread.join(1)
         self.sock.close()
 
-    def move(self):
+    def _next_direction(self, timeout=None):
         """
-        Moves the robot sequentially, one cell at the time until i
+        Takes the first direction from the direction_queue, waits until the server sends one if it's empty.
 
         Parameters
         ----------
-        tempeture_check(=True): boolean
-            A flag that indicates if the robot should preform a temperature check, by default true.
+        timeout: float
+            Max amount of seconds to wait for a direction, None waits forever. Returns None if it runs out.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            try:
+                return self.direction_queue.popleft()
+            except IndexError:
+                pass
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            if not self._direction_event.wait(remaining):
+                return None
+            self._direction_event.clear()
+
+    def move(self):
+        """
+        Moves the robot sequentially, one cell at the time until i
+
+        Returns "not_move" if no direction arrives within DIRECTION_TIMEOUT and "done" if the robot was stopped,
+        otherwise None. A coordinate (x, y) in the direction_queue is driven to with move_to_coords.
 
         Raises
         ------
@@ -346,54 +824,85 @@ class Robot():
             If the command isn't in the format (x, y), Exception is raised.
 
         """
-        try:
-            direction = self.direction_queue.get()
-        except:
-            print("No directions available!")
+        direction = self._next_direction(DIRECTION_TIMEOUT)
+        if direction is None:
             return "not_move"
+        if direction is _STOP:
+            return "done"
 
-        if direction == "pickup":
-            print("Robot reached it destination!")
-            self.lift_arm()
-        elif direction == "dropoff":
-            print("Robot reached it destination!")
-            self.lower_arm()
-
-        elif direction == "forward":
-            self.run()
-
-        elif direction == "backward":
-            self.back()
-
-        elif direction == "right":
-            if self.current_direction == "north":
-                self.current_direction = "east"
-            elif self.current_direction == "south":
-                self.current_direction = "west"
-            elif self.current_direction == "west":
-                self.current_direction = "north"
-            elif self.current_direction == "east":
-                self.current_direction = "south"
-            self.wheels_motor.on_for_degrees(steering = 100, speed = 25, degrees = 200)
-
-        elif direction == "left":
-            if self.current_direction == "north":
-                self.current_direction = "west"
-            elif self.current_direction == "south":
-                self.current_direction = "east"
-            elif self.current_direction == "west":
-                self.current_direction = "south"
-            elif self.current_direction == "east":
-                self.current_direction = "north"
-            self.wheels_motor.on_for_degrees(steering = -100, speed = 25, degrees = 200)
-
-        elif direction == False:
-            print("No no path to the goal could be calculated!")
-
+        if isinstance(direction, tuple):
+            self.move_to_coords(direction)
         else:
-            raise Exception("The direction in move() has to be either, goal, forward, backward, right or left!")
+            handler = self._MOVE_HANDLERS.get(direction)
+            if handler is None:
+                raise Exception("The direction in move() has to be either, goal, forward, backward, right or left!")
+            handler(self)
+
+        self._send_position()
+
+    def _send_position(self):
+        """
+        Sends the robots position to the server. The message is built once, only the coordinates are packed into it for
+        every update. The update is skipped if the position hasn't changed since the last update, or if the last update
+        was sent less than POSITION_UPDATE_INTERVAL seconds ago.
+        """
+        position = (self.current_location_x, self.current_location_y)
+        now = monotonic()
+        if position != self._last_sent_position and now - self._last_sent_time >= POSITION_UPDATE_INTERVAL:
+            frame = self._position_frame
+            if self.DEBUG_PICKLE:
+                _PICKLE_INT.pack_into(frame, _PICKLE_X_OFFSET, position[0])
+                _PICKLE_INT.pack_into(frame, _PICKLE_Y_OFFSET, position[1])
+            else:
+                _XY.pack_into(frame, _XY_OFFSET, position[0], position[1])
+            self._send_queue.append(bytes(frame))
+            self._send_event.set()
+            self._last_sent_position = position
+            self._last_sent_time = now
+
+    def _on_pickup(self):
+        """
+        Handles a pickup direction, the robot has reached its destination and lifts its arm.
+        """
+        print("Robot reached it destination!")
+        self.lift_arm()
+
+    def _on_dropoff(self):
+        """
+        Handles a dropoff direction, the robot has reached its destination and lowers its arm.
+        """
+        print("Robot reached it destination!")
+        self.lower_arm()
 
-        self.sock.sendall(pickle.dumps(["pos", (self.current_location_x, self.current_location_y)]))
+    def _turn(self, turn):
+        """
+        Turns the robot 90 degrees on the spot and updates current_direction.
+
+        Parameters
+        ----------
+        turn: int
+            1 to turn right, -1 to turn left.
+        """
+        self.current_direction = Direction((self.current_direction + turn) & 3)
+        self.wheels_motor.on_for_degrees(steering = 100 * turn, speed = _speed(25), degrees = 200)
+
+    def _turn_right(self):
+        """
+        Turns the robot 90 degrees to the right.
+        """
+        self._turn(1)
+
+    def _turn_left(self):
+        """
+        Turns the robot 90 degrees to the left.
+        """
+        self._turn(-1)
+
+    def _on_no_path(self):
+        """
+        Handles the server not being able to calculate a path to the goal.
+        """
+        print("No no path to the goal could be calculated!")
 
     def move_to_coords(self, coordinate):
         """
@@ -406,9 +915,6 @@ class Robot():
             Coordinate to which the robot should move_to_coords, if left empty the robots moves to the first coordinate in the
             coordinate queue. It the queue is empty, the robot will automatic create a new coordinate.
 
-        tempeture_check(=True): boolean
-            A flag that indicates if the robot should preform a temperature check, by default true.
-
         Raises
         ------
         Exception:
@@ -417,35 +923,47 @@ class Robot():
         Exception:
             If the input isn't in the format (x, y) or None, Exception is raised.
 
+        TimeoutError:
+            If the robot doesn't reach the coordinate within CELL_TIMEOUT seconds per cell, the robot brakes and
+            TimeoutError is raised.
+
         """
         try:
             X, Y = coordinate
-        except :
+        except (TypeError, ValueError):
             raise Exception("Wrong format of the input coordinates!")
 
-        print("The robot has started to move_to_coords to: (" + X + ", " + Y + ")")
+        print("The robot has started to move_to_coords to: (" + str(X) + ", " + str(Y) + ")")
 
-        if self.current_location_x < X:
-            self.turn_cardinal("east")
-        else:
-            self.turn_cardinal("west")
+        run = self.run
+        update_position = self._update_current_position
 
-        self.run()
-        while (self.current_location_x != X):
-            self.run()
-            self._update_current_position(self.current_direction)
+        if self.current_location_x != X:
+            self.turn_cardinal(Direction.EAST if self.current_location_x < X else Direction.WEST)
+            deadline = monotonic() + CELL_TIMEOUT * abs(X - self.current_location_x)
+            while self.current_location_x != X:
+                self._check_deadline(deadline)
+                run()
+                update_position(self.current_direction)
 
-        if self.current_location_y < Y:
-            self.turn_cardinal("south")
-        else:
-            self.turn_cardinal("north")
+        if self.current_location_y != Y:
+            self.turn_cardinal(Direction.NORTH if self.current_location_y < Y else Direction.SOUTH)
+            deadline = monotonic() + CELL_TIMEOUT * abs(Y - self.current_location_y)
+            while self.current_location_y != Y:
+                self._check_deadline(deadline)
+                run()
+                update_position(self.current_direction)
 
-        self.run()
-        while self.current_location_y != Y:
-            self.run()
-            self._update_current_position(self.current_direction)
+        print("Robot has reaches it's destination at: (" + str(X) + ", " + str(Y) + ")")
 
-        print("Robot has reaches it's destination at: (" + X + ", " + Y + ")")
+    def _check_deadline(self, deadline):
+        """
+        Brakes the robot and raises TimeoutError if the deadline, a time.monotonic() timestamp, has passed.
+        """
+        if monotonic() > deadline:
+            self.brake()
+            raise TimeoutError("The robot got stuck on its way, it's now at: (" + str(self.current_location_x) + ", " +
+                               str(self.current_location_y) + ")")
 
     @property
     def serialize(self):
@@ -453,38 +971,36 @@ class Robot():
             'id': self.id,
             'current_location_x': self.current_location_x,
             'current_location_y': self.current_location_y,
-            'current_direction': self.current_direction
+            'current_direction': self.current_direction.name.lower()
         }
 
     def assign_coordinate(self, current_location_x, current_location_y, current_direction):
         self.current_location_x = current_location_x
         self.current_location_y = current_location_y
-        self.current_direction = current_direction
+        self.current_direction = _to_direction(current_direction)
 
     def _update_current_position(self, direction, forward=True):
-        if forward:
-            if (direction == "north"):
-                self.current_location_y += 1
-            elif (direction == "east"):
-                self.current_location_x += 1
-            elif (direction == "south"):
-                self.current_location_y -= 1
-            elif (direction == "west"):
-                self.current_location_x -= 1
-            elif (direction == "center"):
-                {}
-            else:
-                return 1
-        else:
-            if (direction == "north"):
-                self.current_location_y -= 1
-            elif (direction == "east"):
-                self.current_location_x -= 1
-            elif (direction == "south"):
-                self.current_location_y += 1
-            elif (direction == "west"):
-                self.current_location_x += 1
-            elif (direction == "center"):
-                {}
-            else:
-                return 1
+        # "center" means the robot stays in its cell.
+        if direction == "center":
+            return
+        try:
+            dx, dy = self._STEPS[_to_direction(direction)]
+        except ValueError:
+            return 1
+        sign = 1 if forward else -1
+        self.current_location_x += sign * dx
+        self.current_location_y += sign * dy
+
+    # The handlers of the commands received from the server, indexed by their opcode.
+    _COMMAND_HANDLERS = (_on_end, _on_manual, _on_auto, _on_start, _on_stop)
+
+    # The handlers of the directions in the direction_queue, by opcode.
+    _MOVE_HANDLERS = {
+        OP_FORWARD: run,
+        OP_BACKWARD: back,
+        OP_LEFT: _turn_left,
+        OP_RIGHT: _turn_right,
+        OP_PICKUP: _on_pickup,
+        OP_DROPOFF: _on_dropoff,
+        OP_NO_PATH: _on_no_path,
+    }